@@ -1,15 +1,60 @@
+import numpy as np
 import pandas as pd
 import requests
 import os
+import shutil
 import argparse
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import glob
+import hashlib
+import io
+import joblib
+from joblib import Parallel, delayed
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
 
 import zipfile
 
 ZIP_URL = "https://cordis.europa.eu/data/cordis-HORIZONprojects-csv.zip"
+DATA_DIR = 'cordis_data'
 
-def download_and_extract(url, data_dir):
+# Only the columns we actually use, with explicit dtypes so nothing has to be inferred.
+# IDs are read as text so one malformed value can't fail the whole load; slim_dtypes converts them.
+PROJECT_DTYPES = {
+    'id': 'string[pyarrow]',
+    'title': 'string[pyarrow]',
+    'objective': 'string[pyarrow]',
+    'topics': 'string[pyarrow]',
+    'acronym': 'string[pyarrow]',
+    'startDate': 'string[pyarrow]',
+    'endDate': 'string[pyarrow]',
+}
+ORG_DTYPES = {
+    'projectID': 'string[pyarrow]',
+    'role': 'string[pyarrow]',
+    'name': 'string[pyarrow]',
+    'country': 'string[pyarrow]',
+    'city': 'string[pyarrow]',
+    'shortName': 'string[pyarrow]',
+}
+# Field values read as missing, matching pandas' default na_values.
+CSV_NULL_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                   '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+# Column order of the result tuples returned by find_coordinators.
+RESULT_COLUMNS = ('Similarity Score', 'Project ID', 'Project Acronym', 'Project Title', 'Start Date', 'End Date',
+                  'Coordinator Name', 'Coordinator Country', 'Coordinator City')
+# Features must appear in at least MIN_DF projects and at most a MAX_DF fraction of them.
+MIN_DF = 2
+MAX_DF = 0.95
+# Minimum number of project texts per parallel tokenization shard.
+MIN_SHARD_SIZE = 5000
+# Low-cardinality columns stored as categoricals, and ID columns downcast to the smallest unsigned int.
+CATEGORY_COLUMNS = ('role', 'country')
+ID_COLUMNS = ('id', 'projectID')
+# Project columns kept next to the cached TF-IDF matrix for reporting results.
+CACHED_PROJECT_COLUMNS = ['id', 'title', 'acronym', 'startDate', 'endDate', 'topics']
+
+def download_and_extract(url, data_dir, cache_zip=False):
     if not os.path.exists(data_dir):
         os.makedirs(data_dir)
     
@@ -21,86 +66,306 @@ def download_and_extract(url, data_dir):
         return
 
     zip_path = os.path.join(data_dir, "cordis.zip")
-    if not os.path.exists(zip_path):
+    if os.path.exists(zip_path):
+        zip_source = zip_path
+    else:
         print(f"Downloading {url}...")
         try:
             headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, stream=True, headers=headers)
-            response.raise_for_status()
-            with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Keep the archive in memory and extract straight from it, unless asked to keep a copy on disk.
+            zip_source = io.BytesIO()
+            with requests.get(url, stream=True, headers=headers) as response:
+                response.raise_for_status()
+                # Copy the raw stream in 1 MiB blocks to keep per-chunk Python overhead low.
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, zip_source, length=1 << 20)
             print("Download complete.")
         except Exception as e:
             print(f"Error downloading: {e}")
             raise e
-            
+        if cache_zip:
+            with open(zip_path, 'wb') as f:
+                f.write(zip_source.getbuffer())
+        zip_source.seek(0)
+
     print("Extracting ZIP archive...")
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+    with zipfile.ZipFile(zip_source, 'r') as zip_ref:
         zip_ref.extractall(data_dir)
     print("Extraction complete.")
 
-def load_data():
-    data_dir = 'cordis_data'
-    download_and_extract(ZIP_URL, data_dir)
+def read_cordis_csv(path, dtypes):
+    # CORDIS CSVs are usually semicolon separated. Let's be lenient with parse errors if any.
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        print("pyarrow not available, falling back to the C parser...")
+        dtypes = {col: 'string' if dtype == 'string[pyarrow]' else dtype for col, dtype in dtypes.items()}
+        return pd.read_csv(path, sep=';', on_bad_lines='skip', engine='c',
+                           usecols=list(dtypes), dtype=dtypes)
+
+    # pandas pads rows with too few fields instead of dropping them, so set those aside and parse them below.
+    short_rows = []
+    def handle_invalid_row(row):
+        if row.actual_columns < row.expected_columns:
+            short_rows.append(row.text)
+        return 'skip'
+
+    # PyArrow parses blocks of the memory-mapped file on all cores and keeps strings in Arrow buffers.
+    arrow_types = {'string[pyarrow]': pa.string()}
+    with pa.memory_map(path, 'r') as source:
+        table = pacsv.read_csv(
+            source,
+            read_options=pacsv.ReadOptions(block_size=8 << 20, use_threads=True),
+            parse_options=pacsv.ParseOptions(delimiter=';', newlines_in_values=True,
+                                             invalid_row_handler=handle_invalid_row),
+            # Treat empty and NA-like fields as missing, the same way pandas' readers do.
+            convert_options=pacsv.ConvertOptions(include_columns=list(dtypes),
+                                                 column_types={col: arrow_types[dtype] for col, dtype in dtypes.items()},
+                                                 null_values=CSV_NULL_VALUES, strings_can_be_null=True,
+                                                 quoted_strings_can_be_null=True),
+        )
+    df = table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+    if not short_rows:
+        return df
+
+    with open(path, encoding='utf-8') as f:
+        header = f.readline()
+    padded = pd.read_csv(io.StringIO(header + '\n'.join(short_rows)), sep=';', on_bad_lines='skip', engine='c',
+                         usecols=list(dtypes), dtype=dtypes)
+    return pd.concat([df, padded], ignore_index=True)
+
+def pin_category_dtypes(df):
+    # Parquet restores categories with pandas' default string dtype, so pin them to Arrow strings
+    # to keep missing values reading back the same (<NA>) on cached and freshly parsed frames.
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            categories = df[col].cat.categories.astype('string[pyarrow]')
+            df[col] = df[col].astype(pd.CategoricalDtype(categories))
+    return df
+
+def slim_dtypes(df):
+    # Smaller dtypes mean fewer bytes read per scan in the role filter and the projectID groupby.
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    df = pin_category_dtypes(df)
+    for col in ID_COLUMNS:
+        if col in df.columns:
+            # Rows whose ID isn't numeric can't be matched to anything, so drop them.
+            ids = pd.to_numeric(df[col].astype(object), errors='coerce')
+            df = df[ids.notna()].reset_index(drop=True)
+            df[col] = pd.to_numeric(ids.dropna().astype('int64').to_numpy(), downcast='unsigned')
+    return df
+
+def remove_stale_caches(data_dir, patterns, keep):
+    # Caches are keyed on the dataset, so anything not written for the current one is dead weight.
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(data_dir, pattern)):
+            if path not in keep:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    print(f"Warning: could not remove stale cache {path}: {e}")
+
+def load_data(data_hash, with_projects=True):
+    data_dir = DATA_DIR
+    # Key the Parquet cache on the dataset so a refreshed download never reuses stale frames.
+    project_parquet = os.path.join(data_dir, f'project_{data_hash}.parquet')
+    org_parquet = os.path.join(data_dir, f'organization_{data_hash}.parquet')
 
     print("Loading datasets...")
+    if os.path.exists(project_parquet) and os.path.exists(org_parquet):
+        # Parquet is already typed, so we skip CSV tokenization and type inference entirely.
+        # Projects can be skipped entirely when the TF-IDF cache already holds what we report.
+        try:
+            projects_df = pd.read_parquet(project_parquet, engine='pyarrow') if with_projects else None
+            orgs_df = pin_category_dtypes(pd.read_parquet(org_parquet, engine='pyarrow'))
+            if with_projects:
+                print(f"Loaded {len(projects_df)} projects and {len(orgs_df)} organizations.")
+            else:
+                print(f"Loaded {len(orgs_df)} organizations.")
+            return projects_df, orgs_df
+        except Exception as e:
+            print(f"Error loading cached Parquet files, falling back to CSV: {e}")
+
     try:
-        # CORDIS CSVs are usually semicolon separated. Let's be lenient with parse errors if any.
-        projects_df = pd.read_csv(os.path.join(data_dir, 'project.csv'), sep=';', on_bad_lines='skip', low_memory=False)
-        orgs_df = pd.read_csv(os.path.join(data_dir, 'organization.csv'), sep=';', on_bad_lines='skip', low_memory=False)
+        projects_df = read_cordis_csv(os.path.join(data_dir, 'project.csv'), PROJECT_DTYPES)
+        orgs_df = read_cordis_csv(os.path.join(data_dir, 'organization.csv'), ORG_DTYPES)
     except Exception as e:
         print(f"Error loading datasets: {e}")
         return None, None
+
+    # Normalize roles once; slim_dtypes then makes them categorical so role filters are integer compares.
+    orgs_df['role'] = orgs_df['role'].str.lower()
+    projects_df = slim_dtypes(projects_df)
+    orgs_df = slim_dtypes(orgs_df)
+
+    # Cache as Parquet so subsequent runs don't have to re-parse the CSVs.
+    try:
+        projects_df.to_parquet(project_parquet, engine='pyarrow')
+        orgs_df.to_parquet(org_parquet, engine='pyarrow')
+        remove_stale_caches(data_dir, ['project*.parquet', 'organization*.parquet'],
+                            keep=[project_parquet, org_parquet])
+    except Exception as e:
+        print(f"Warning: could not write Parquet cache: {e}")
     print(f"Loaded {len(projects_df)} projects and {len(orgs_df)} organizations.")
     return projects_df, orgs_df
 
-def find_coordinators(query, n_top=5):
-    projects_df, orgs_df = load_data()
-    if projects_df is None or orgs_df is None:
-        return
+def dataset_hash(data_dir):
+    # The ZIP (or the extracted CSV when the ZIP isn't kept) only changes when a fresh dataset is downloaded.
+    zip_path = os.path.join(data_dir, 'cordis.zip')
+    source = zip_path if os.path.exists(zip_path) else os.path.join(data_dir, 'project.csv')
+    digest = hashlib.sha256()
+    with open(source, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+def load_tfidf_cache(cache_path, matrix_path):
+    if not (os.path.exists(cache_path) and os.path.exists(matrix_path)):
+        return None, None, None
+    try:
+        vectorizer, projects_df = joblib.load(cache_path)
+        tfidf_matrix = sparse.load_npz(matrix_path)
+    except Exception as e:
+        print(f"Error loading TF-IDF cache, recomputing: {e}")
+        return None, None, None
+    print(f"Using cached TF-IDF vectors in {cache_path}.")
+    return vectorizer, tfidf_matrix, projects_df
 
-    # Check for expected columns
-    if 'title' not in projects_df.columns:
-        print(f"Available project columns: {list(projects_df.columns)}")
-        # Handle possible different separator
-        if len(projects_df.columns) == 1:
-            print("It seems the separator might be a comma instead of a semicolon. Trying comma...")
-            projects_df = pd.read_csv('cordis-HEprojects.csv', sep=',', low_memory=False, on_bad_lines='skip')
-            orgs_df = pd.read_csv('cordis-HEorganizations.csv', sep=',', low_memory=False, on_bad_lines='skip')
+def save_tfidf_cache(cache_path, matrix_path, vectorizer, tfidf_matrix, projects_df):
+    # Only keep the columns needed to report results alongside the vectorizer.
+    result_cols = [c for c in CACHED_PROJECT_COLUMNS if c in projects_df.columns]
+    try:
+        joblib.dump((vectorizer, projects_df[result_cols].reset_index(drop=True)), cache_path)
+        sparse.save_npz(matrix_path, tfidf_matrix.tocsr())
+    except Exception as e:
+        print(f"Warning: could not write TF-IDF cache: {e}")
+        return False
+    return True
 
+def hash_project_texts(projects_df, hasher):
     # Combine text fields for projects
     print("Preparing project data...")
     title_col = 'title' if 'title' in projects_df.columns else ''
     obj_col = 'objective' if 'objective' in projects_df.columns else ''
     topics_col = 'topics' if 'topics' in projects_df.columns else ''
     
-    text_data = []
-    if title_col: text_data.append(projects_df[title_col].fillna('').astype(str))
-    if obj_col: text_data.append(projects_df[obj_col].fillna('').astype(str))
-    if topics_col: text_data.append(projects_df[topics_col].fillna('').astype(str))
-    
-    if not text_data:
+    text_cols = [col for col in (title_col, obj_col, topics_col) if col]
+    if not text_cols:
         print("Error: Could not find relevant text columns (title, objective, topics) in projects dataset.")
-        return
+        return None
+
+    # Concatenate the text columns in a single vectorized pass
+    text_data = [projects_df[col].fillna('').astype(str) for col in text_cols]
+    combined_text = text_data[0].str.cat(text_data[1:], sep=' ') if len(text_data) > 1 else text_data[0]
+
+    print("Tokenizing project texts...")
+    # The hasher is stateless, so tokenization can be spread over the available cores and the shards stacked back.
+    # joblib's cpu_count honours affinity and cgroup quotas; small corpora aren't worth the worker spawn cost.
+    n_jobs = max(1, min(joblib.cpu_count(), len(combined_text) // MIN_SHARD_SIZE))
+    if n_jobs == 1:
+        return hasher.transform(combined_text).tocsr()
+    chunks = np.array_split(np.asarray(combined_text, dtype=object), n_jobs)
+    return sparse.vstack(Parallel(n_jobs=n_jobs, backend='loky')(delayed(hasher.transform)(chunk) for chunk in chunks)).tocsr()
 
-    projects_df['combined_text'] = text_data[0]
-    for col_data in text_data[1:]:
-        projects_df['combined_text'] += ' ' + col_data
+def make_vectorizer():
+    # Hashing keeps the feature space bounded and avoids building a vocabulary dict.
+    return Pipeline([
+        ('hash', HashingVectorizer(n_features=2**18, alternate_sign=False, norm=None,
+                                   stop_words='english', ngram_range=(1, 1), dtype=np.float32)),
+        ('tfidf', TfidfTransformer(sublinear_tf=True)),
+    ])
+
+def settings_hash(*settings):
+    # Folded into cache file names so changing vectorizer or pruning settings forces a rebuild.
+    return hashlib.sha256(repr(settings).encode()).hexdigest()[:8]
+
+def build_tfidf(projects_df, vectorizer, counts_path):
+    hasher = vectorizer.named_steps['hash']
+    transformer = vectorizer.named_steps['tfidf']
+
+    # The hashed term counts are the tokenized corpus; reuse them so a refit doesn't re-run the tokenizer.
+    # They are keyed on the hasher settings alone, unlike the TF-IDF cache which also covers the weighting.
+    counts = None
+    if os.path.exists(counts_path):
+        try:
+            counts = sparse.load_npz(counts_path)
+            print(f"Using cached term counts in {counts_path}.")
+        except Exception as e:
+            print(f"Error loading term counts cache, re-tokenizing: {e}")
+    if counts is None:
+        counts = hash_project_texts(projects_df, hasher)
+        if counts is None:
+            return None, None
+        try:
+            sparse.save_npz(counts_path, counts)
+        except Exception as e:
+            print(f"Warning: could not write term counts cache: {e}")
 
     print("Computing TF-IDF vectors...")
-    vectorizer = TfidfVectorizer(stop_words='english')
     # Fit on project texts
-    tfidf_matrix = vectorizer.fit_transform(projects_df['combined_text'])
-    
+    transformer.fit(counts)
+    # Hashing has no vocabulary for min_df/max_df, so drop rare and ubiquitous features through their idf weight.
+    doc_freq = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = transformer.idf_.copy()
+    idf[(doc_freq < MIN_DF) | (doc_freq > MAX_DF * counts.shape[0])] = 0
+    transformer.idf_ = idf
+    tfidf_matrix = transformer.transform(counts)
+    tfidf_matrix.eliminate_zeros()
+    return vectorizer, tfidf_matrix
+
+def find_coordinators(query, n_top=5, cache_zip=False):
+    download_and_extract(ZIP_URL, DATA_DIR, cache_zip)
+    data_hash = dataset_hash(DATA_DIR)
+
+    # The TF-IDF fit only changes with the dataset or the vectorizer settings, so cache it keyed on both.
+    # Check it first: a hit already carries the project columns we report, so only organizations need loading.
+    vectorizer = make_vectorizer()
+    tfidf_key = settings_hash(vectorizer.named_steps['hash'].get_params(),
+                              vectorizer.named_steps['tfidf'].get_params(), MIN_DF, MAX_DF)
+    cache_path = os.path.join(DATA_DIR, f'tfidf_{data_hash}_{tfidf_key}.joblib')
+    matrix_path = os.path.join(DATA_DIR, f'tfidf_{data_hash}_{tfidf_key}.npz')
+    cached_vectorizer, tfidf_matrix, projects_df = load_tfidf_cache(cache_path, matrix_path)
+
+    loaded_projects_df, orgs_df = load_data(data_hash, with_projects=cached_vectorizer is None)
+    if orgs_df is None:
+        return
+
+    # Keep only coordinators and index them by project once, rather than scanning orgs_df per result.
+    if 'role' in orgs_df.columns:
+        coord_df = orgs_df[orgs_df['role'].eq('coordinator')]
+    else:
+        coord_df = orgs_df.iloc[0:0] # empty if role column missing
+    coord_positions = coord_df.groupby('projectID').indices
+
+    if cached_vectorizer is None:
+        projects_df = loaded_projects_df
+        # Term counts only depend on the hasher, so a weighting or pruning change reuses them without re-tokenizing.
+        counts_key = settings_hash(vectorizer.named_steps['hash'].get_params())
+        counts_path = os.path.join(DATA_DIR, f'counts_{data_hash}_{counts_key}.npz')
+        vectorizer, tfidf_matrix = build_tfidf(projects_df, vectorizer, counts_path)
+        if vectorizer is None:
+            return
+        if save_tfidf_cache(cache_path, matrix_path, vectorizer, tfidf_matrix, projects_df):
+            remove_stale_caches(DATA_DIR, ['tfidf*', 'counts_*'], keep=[cache_path, matrix_path, counts_path])
+    else:
+        vectorizer = cached_vectorizer
+
     # Transform query
     query_vec = vectorizer.transform([query])
     
     print("Calculating similarity...")
-    similarities = cosine_similarity(query_vec, tfidf_matrix).flatten()
+    # Both sides are already L2-normalized by the TfidfTransformer, so cosine similarity is just a dot product.
+    similarities = np.asarray(tfidf_matrix.dot(query_vec.T).todense()).ravel()
     
-    # Get top matching projects
-    top_indices = similarities.argsort()[-n_top:][::-1]
+    # Get top matching projects, partitioning first so only the top k have to be sorted
+    if n_top < len(similarities):
+        part = np.argpartition(similarities, -n_top)[-n_top:]
+        top_indices = part[np.argsort(-similarities[part])]
+    else:
+        top_indices = np.argsort(-similarities)
     
     print("\n" + "="*80)
     print(f"Top {n_top} matching projects for query: '{query[:50]}...'")
@@ -108,16 +373,12 @@ def find_coordinators(query, n_top=5):
     
     results = []
 
-    for i, idx in enumerate(top_indices):
-        project = projects_df.iloc[idx]
+    # Pull the reported columns for just the top rows at once, rather than building a Series per row.
+    project_rows = projects_df.iloc[top_indices].reindex(columns=CACHED_PROJECT_COLUMNS, fill_value='Unknown').to_numpy(dtype=object)
+
+    for i, (idx, project_row) in enumerate(zip(top_indices, project_rows)):
         sim_score = similarities[idx]
-        project_id = project.get('projectID', project.get('id', 'Unknown'))
-        
-        title = project.get('title', 'Unknown')
-        acronym = project.get('acronym', 'Unknown')
-        topics = project.get('topics', 'Unknown')
-        start_date = project.get('startDate', 'Unknown')
-        end_date = project.get('endDate', 'Unknown')
+        project_id, title, acronym, start_date, end_date, topics = project_row
         
         print(f"\n[{i+1}] Score: {sim_score:.4f} | Project: {title}")
         print(f"    ID: {project_id} | Acronym: {acronym}")
@@ -125,43 +386,26 @@ def find_coordinators(query, n_top=5):
         print(f"    Topics: {topics}")
         
         # Find coordinators for this project
-        project_orgs = orgs_df[orgs_df['projectID'] == project_id]
-        if 'role' in project_orgs.columns:
-            coordinators = project_orgs[project_orgs['role'].str.lower() == 'coordinator']
-        else:
-            coordinators = pd.DataFrame() # empty if role column missing
+        positions = coord_positions.get(project_id)
+        coordinators = coord_df.iloc[positions] if positions is not None else coord_df.iloc[0:0]
 
         if not coordinators.empty:
-            for _, org in coordinators.iterrows():
-                print(f"    => COORDINATOR: {org.get('name', 'Unknown')}")
-                print(f"       Country: {org.get('country', 'Unknown')} | City: {org.get('city', 'Unknown')}")
-                if 'shortName' in org and pd.notna(org['shortName']):
-                     print(f"       Short Name: {org['shortName']}")
+            # Walk the needed columns directly instead of building a Series per row with iterrows()
+            org_cols = coordinators.reindex(columns=['name', 'country', 'city'], fill_value='Unknown')
+            short_names = coordinators['shortName'] if 'shortName' in coordinators.columns else pd.Series([None] * len(coordinators))
+            for name, country, city, short_name in zip(org_cols['name'].values, org_cols['country'].values,
+                                                       org_cols['city'].values, short_names.values):
+                print(f"    => COORDINATOR: {name}")
+                print(f"       Country: {country} | City: {city}")
+                if pd.notna(short_name):
+                     print(f"       Short Name: {short_name}")
                      
-                results.append({
-                    'Similarity Score': round(sim_score, 4),
-                    'Project ID': project_id,
-                    'Project Acronym': acronym,
-                    'Project Title': title,
-                    'Start Date': start_date,
-                    'End Date': end_date,
-                    'Coordinator Name': org.get('name', 'Unknown'),
-                    'Coordinator Country': org.get('country', 'Unknown'),
-                    'Coordinator City': org.get('city', 'Unknown')
-                })
+                results.append((round(sim_score, 4), project_id, acronym, title, start_date, end_date,
+                                name, country, city))
         else:
             print("    => COORDINATOR: None found in organization data.")
-            results.append({
-                'Similarity Score': round(sim_score, 4),
-                'Project ID': project_id,
-                'Project Acronym': acronym,
-                'Project Title': title,
-                'Start Date': start_date,
-                'End Date': end_date,
-                'Coordinator Name': 'None found',
-                'Coordinator Country': '',
-                'Coordinator City': ''
-            })
+            results.append((round(sim_score, 4), project_id, acronym, title, start_date, end_date,
+                            'None found', '', ''))
             
     return results
 
@@ -170,6 +414,7 @@ if __name__ == "__main__":
     parser.add_argument("query", type=str, nargs='?', default=None, help="Text description or keywords of the future call.")
     parser.add_argument("--top", type=int, default=10, help="Number of top projects to return.")
     parser.add_argument("--csv", type=str, help="Optional CSV filename to save the results.")
+    parser.add_argument("--cache-zip", action="store_true", help="Keep the downloaded ZIP archive on disk.")
     try:
         args = parser.parse_args()
         query = args.query
@@ -181,9 +426,9 @@ if __name__ == "__main__":
             query = input("\nPlease enter the keywords or description for your Horizon call:\n> ")
             
         if query and query.strip():
-            results = find_coordinators(query.strip(), args.top)
+            results = find_coordinators(query.strip(), args.top, args.cache_zip)
             if args.csv and results:
-                pd.DataFrame(results).to_csv(args.csv, index=False)
+                pd.DataFrame.from_records(results, columns=RESULT_COLUMNS).to_csv(args.csv, index=False)
                 print(f"\nResults saved to {args.csv}")
         else:
             print("No query provided.")
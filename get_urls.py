@@ -1,8 +1,15 @@
+import ijson
 import requests
-import json
 
-data = requests.get('https://data.europa.eu/api/hub/search/datasets/cordis-eu-research-projects-under-horizon-europe-2021-2027').json()
-urls = [d.get('access_url') for d in data['result']['distributions'] if 'csv' in str(d).lower()]
+# Stream the distributions out of the API response instead of loading the whole JSON document.
+urls = []
+with requests.get('https://data.europa.eu/api/hub/search/datasets/cordis-eu-research-projects-under-horizon-europe-2021-2027', stream=True) as response:
+    response.raise_for_status()
+    response.raw.decode_content = True
+    for d in ijson.items(response.raw, 'result.distributions.item'):
+        fmt = ((d.get('format') or {}).get('id') or '').lower()
+        if 'csv' in fmt or 'csv' in str(d.get('access_url')).lower():
+            urls.append(d.get('access_url'))
 with open('urls.txt', 'w') as f:
     for url in urls:
         f.write(str(url) + '\n')